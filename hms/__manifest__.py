@@ -1,6 +1,6 @@
 {
     "name": "Hospital Management System",
-    "version": "1.1",
+    "version": "1.2",
     "category": "Healthcare",
     "summary": "Manage hospital patients",
     "license": "LGPL-3",
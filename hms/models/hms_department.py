@@ -49,6 +49,13 @@ class HmsDepartment(models.Model):
     )
 
     # Computed Fields
+    display_name = fields.Char(
+        string="Display Name",
+        compute="_compute_display_name",
+        store=True,
+        help="Department name with its status and capacity info",
+    )
+
     current_patient_count = fields.Integer(
         string="Current Patients",
         compute="_compute_current_patient_count",
@@ -59,16 +66,37 @@ class HmsDepartment(models.Model):
     capacity_utilization = fields.Float(
         string="Capacity Utilization (%)",
         compute="_compute_capacity_utilization",
+        store=True,
         help="Percentage of department capacity currently used",
     )
 
-    @api.depends("patients")
+    @api.depends("name", "is_opened", "current_patient_count", "capacity")
+    def _compute_display_name(self):
+        """
+        Compute display name showing department status and capacity info.
+        """
+        for record in self:
+            status = "Open" if record.is_opened else "Closed"
+            record.display_name = f"{record.name} ({status} - {record.current_patient_count}/{record.capacity})"
+
+    @api.depends("patients.department_id")
     def _compute_current_patient_count(self):
         """
         Compute the current number of patients in the department.
+
+        Counts are aggregated in a single grouped query instead of loading
+        the patients of every department.
         """
+        groups = self.env["hms.patient"].read_group(
+            [("department_id", "in", self._origin.ids)],
+            ["department_id"],
+            ["department_id"],
+        )
+        counts = {
+            group["department_id"][0]: group["department_id_count"] for group in groups
+        }
         for record in self:
-            record.current_patient_count = len(record.patients)
+            record.current_patient_count = counts.get(record._origin.id, 0)
 
     @api.depends("current_patient_count", "capacity")
     def _compute_capacity_utilization(self):
@@ -76,21 +104,19 @@ class HmsDepartment(models.Model):
         Calculate the capacity utilization percentage.
         """
         for record in self:
-            if record.capacity > 0:
-                record.capacity_utilization = (
-                    record.current_patient_count / record.capacity
-                ) * 100
-            else:
-                record.capacity_utilization = 0.0
+            record.capacity_utilization = (
+                record.current_patient_count * 100.0 / record.capacity
+                if record.capacity > 0
+                else 0.0
+            )
 
     @api.constrains("capacity")
     def _check_capacity_positive(self):
         """
         Ensure department capacity is not negative.
         """
-        for record in self:
-            if record.capacity < 0:
-                raise ValidationError("Department capacity cannot be negative!")
+        if self.filtered(lambda record: record.capacity < 0):
+            raise ValidationError("Department capacity cannot be negative!")
 
     @api.constrains("current_patient_count", "capacity")
     def _check_capacity_not_exceeded(self):
@@ -104,14 +130,3 @@ class HmsDepartment(models.Model):
                     f"of {record.capacity} patients. "
                     f"Current patients: {record.current_patient_count}"
                 )
-
-    def name_get(self):
-        """
-        Custom display name showing department status and capacity info.
-        """
-        result = []
-        for record in self:
-            status = "Open" if record.is_opened else "Closed"
-            name = f"{record.name} ({status} - {record.current_patient_count}/{record.capacity})"
-            result.append((record.id, name))
-        return result
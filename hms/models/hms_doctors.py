@@ -6,9 +6,16 @@ This module defines the Doctors model for the Hospital Management System.
 It manages doctor information and their assignments to patients.
 """
 
+import re
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Allow various phone formats: +1234567890, (123) 456-7890, 123-456-7890, etc.
+_PHONE_RE = re.compile(r"^[\+]?[\s\-\(\)0-9]{10,20}$")
+
 
 class HmsDoctors(models.Model):
     """
@@ -72,7 +79,8 @@ class HmsDoctors(models.Model):
         string="Display Name",
         compute="_compute_display_name",
         store=True,
-        help="Full name of the doctor for display purposes",
+        precompute=True,
+        help="Full name of the doctor with specialization and status",
     )
 
     patient_count = fields.Integer(
@@ -81,75 +89,82 @@ class HmsDoctors(models.Model):
         help="Total number of patients assigned to this doctor",
     )
 
-    @api.depends("first_name", "last_name")
+    @api.depends("first_name", "last_name", "specialization", "is_active")
     def _compute_display_name(self):
         """
-        Compute the full display name of the doctor.
+        Compute the full display name of the doctor, including specialization
+        and inactive status when relevant.
         """
         for record in self:
             if record.first_name and record.last_name:
-                record.display_name = f"Dr. {record.first_name} {record.last_name}"
+                name = f"Dr. {record.first_name} {record.last_name}"
             elif record.first_name:
-                record.display_name = f"Dr. {record.first_name}"
+                name = f"Dr. {record.first_name}"
             elif record.last_name:
-                record.display_name = f"Dr. {record.last_name}"
+                name = f"Dr. {record.last_name}"
             else:
-                record.display_name = "Dr. [Name Missing]"
+                name = "Dr. [Name Missing]"
+            if record.specialization:
+                name += f" ({record.specialization})"
+            if not record.is_active:
+                name += " [Inactive]"
+            record.display_name = name
 
     @api.depends("patient_ids")
     def _compute_patient_count(self):
         """
         Compute the number of patients assigned to each doctor.
+
+        Counts are read from the relation table in a single grouped query
+        instead of loading the patients of every doctor.
         """
+        counts = {}
+        doctor_ids = self._origin.ids
+        if doctor_ids:
+            self.env["hms.patient"].flush_model(["doctors_ids"])
+            self.flush_model(["patient_ids"])
+            self.env.cr.execute(
+                """
+                SELECT doctor_id, COUNT(*)
+                  FROM hms_patient_doctor_rel
+                 WHERE doctor_id = ANY(%s)
+              GROUP BY doctor_id
+                """,
+                [doctor_ids],
+            )
+            counts = dict(self.env.cr.fetchall())
         for record in self:
-            record.patient_count = len(record.patient_ids)
+            record.patient_count = counts.get(record._origin.id, 0)
 
     @api.constrains("email")
     def _check_email_format(self):
         """
         Validate email format if provided.
         """
-        import re
-
-        for record in self:
-            if record.email:
-                email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                if not re.match(email_pattern, record.email):
-                    raise ValidationError(
-                        f"Invalid email format for Dr. {record.first_name} {record.last_name}. "
-                        "Please enter a valid email address."
-                    )
+        invalid = self.filtered(
+            lambda record: record.email and not _EMAIL_RE.match(record.email)
+        )
+        if invalid:
+            record = invalid[0]
+            raise ValidationError(
+                f"Invalid email format for Dr. {record.first_name} {record.last_name}. "
+                "Please enter a valid email address."
+            )
 
     @api.constrains("phone")
     def _check_phone_format(self):
         """
         Validate phone number format if provided.
         """
-        import re
-
-        for record in self:
-            if record.phone:
-                # Allow various phone formats: +1234567890, (123) 456-7890, 123-456-7890, etc.
-                phone_pattern = r"^[\+]?[\s\-\(\)0-9]{10,20}$"
-                if not re.match(phone_pattern, record.phone):
-                    raise ValidationError(
-                        f"Invalid phone number format for Dr. {record.first_name} {record.last_name}. "
-                        "Please enter a valid phone number."
-                    )
-
-    def name_get(self):
-        """
-        Custom display name with specialization if available.
-        """
-        result = []
-        for record in self:
-            name = f"Dr. {record.first_name} {record.last_name}"
-            if record.specialization:
-                name += f" ({record.specialization})"
-            if not record.is_active:
-                name += " [Inactive]"
-            result.append((record.id, name))
-        return result
+        invalid = self.filtered(
+            lambda record: record.phone and not _PHONE_RE.match(record.phone)
+        )
+        if invalid:
+            record = invalid[0]
+            raise ValidationError(
+                f"Invalid phone number format for Dr. {record.first_name} {record.last_name}. "
+                "Please enter a valid phone number."
+            )
 
     def toggle_active_status(self):
         """
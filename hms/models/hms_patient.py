@@ -7,11 +7,33 @@ It manages patient information, medical records, and department assignments.
 """
 
 from odoo import models, fields, api
+from odoo.fields import Command
 from odoo.exceptions import ValidationError, UserError
 from datetime import date
 import re
 from odoo import api, SUPERUSER_ID
 
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+_STATE_SELECTION = [
+    ("undetermined", "Undetermined"),
+    ("good", "Good"),
+    ("fair", "Fair"),
+    ("serious", "Serious"),
+]
+_STATE_LABELS = dict(_STATE_SELECTION)
+
+
+def _get_age(birth_date, today):
+    """
+    Return the age in full years at ``today`` for the given birth date.
+    """
+    return (
+        today.year
+        - birth_date.year
+        - ((today.month, today.day) < (birth_date.month, birth_date.day))
+    )
+
 
 class HmsPatient(models.Model):
     """
@@ -26,6 +48,14 @@ class HmsPatient(models.Model):
     _order = "last_name, first_name"
     _rec_name = "display_name"
 
+    _sql_constraints = [
+        (
+            "hms_patient_email_uniq",
+            "UNIQUE(email)",
+            "Email address must be unique across patients.",
+        ),
+    ]
+
     # ========================================
     # PERSONAL INFORMATION FIELDS
     # ========================================
@@ -60,6 +90,9 @@ class HmsPatient(models.Model):
 
     history = fields.Html(
         string="Medical History",
+        compute="_compute_history",
+        store=True,
+        readonly=False,
         help="Patient's medical history (only visible for patients 50+ years old)",
     )
 
@@ -86,7 +119,9 @@ class HmsPatient(models.Model):
 
     pcr = fields.Boolean(
         string="PCR Required",
-        default=False,
+        compute="_compute_pcr",
+        store=True,
+        readonly=False,
         help="Indicates if PCR test is required (auto-checked for patients under 30)",
     )
 
@@ -96,15 +131,15 @@ class HmsPatient(models.Model):
 
     age = fields.Integer(
         string="Age ",
-        compute="_compute_age",
-        store=True,
-        help="Patient's age calculated from birth date",
+        readonly=True,
+        help="Patient's age calculated from birth date by the database",
     )
 
     display_name = fields.Char(
         string="Display Name",
         compute="_compute_display_name",
         store=True,
+        precompute=True,
         help="Full name with email for identification",
     )
 
@@ -115,6 +150,7 @@ class HmsPatient(models.Model):
     department_id = fields.Many2one(
         comodel_name="hms.department",
         string="Department",
+        index=True,
         help="Department where patient is assigned",
     )
 
@@ -132,12 +168,7 @@ class HmsPatient(models.Model):
     # ========================================
 
     state = fields.Selection(
-        selection=[
-            ("undetermined", "Undetermined"),
-            ("good", "Good"),
-            ("fair", "Fair"),
-            ("serious", "Serious"),
-        ],
+        selection=_STATE_SELECTION,
         string="Medical State",
         default="undetermined",
         required=True,
@@ -157,7 +188,7 @@ class HmsPatient(models.Model):
 
     capacity = fields.Integer(
         string="Department Capacity",
-        compute="_compute_capacity",
+        related="department_id.capacity",
         help="Maximum capacity of the assigned department",
     )
 
@@ -165,51 +196,43 @@ class HmsPatient(models.Model):
     # COMPUTED FIELD METHODS
     # ========================================
 
-    @api.depends("first_name", "last_name", "email")
-    def _compute_display_name(self):
+    @api.depends("birth_date")
+    def _compute_history(self):
         """
-        Compute display name combining first name, last name, and email.
+        Clear medical history for patients under 50.
         """
+        today = date.today()
         for record in self:
-            if record.first_name and record.last_name and record.email:
-                record.display_name = (
-                    f"{record.first_name} {record.last_name} ({record.email})"
-                )
-            elif record.first_name and record.last_name:
-                record.display_name = f"{record.first_name} {record.last_name}"
+            if record.birth_date and _get_age(record.birth_date, today) < 50:
+                record.history = False
             else:
-                record.display_name = record.email or "Unnamed Patient"
+                record.history = record.history
 
     @api.depends("birth_date")
-    def _compute_age(self):
+    def _compute_pcr(self):
         """
-        Calculate patient's age based on birth date.
+        Automatically require PCR for patients under 30.
         """
         today = date.today()
         for record in self:
-            if record.birth_date:
-                birth_date = record.birth_date
-                age = today.year - birth_date.year
-
-                # Adjust age if birthday hasn't occurred this year
-                if today.month < birth_date.month or (
-                    today.month == birth_date.month and today.day < birth_date.day
-                ):
-                    age -= 1
-
-                record.age = max(0, age)  # Ensure age is not negative
-            else:
-                record.age = 0
+            record.pcr = record.pcr or bool(
+                record.birth_date and _get_age(record.birth_date, today) < 30
+            )
 
-    @api.depends("department_id")
-    def _compute_capacity(self):
+    @api.depends("first_name", "last_name", "email")
+    def _compute_display_name(self):
         """
-        Get the capacity of the assigned department.
+        Compute display name combining first name, last name, and email.
         """
         for record in self:
-            record.capacity = (
-                record.department_id.capacity if record.department_id else 0
-            )
+            if record.first_name and record.last_name and record.email:
+                record.display_name = (
+                    f"{record.first_name} {record.last_name} ({record.email})"
+                )
+            elif record.first_name and record.last_name:
+                record.display_name = f"{record.first_name} {record.last_name}"
+            else:
+                record.display_name = record.email or "Unnamed Patient"
 
     # ========================================
     # VALIDATION METHODS
@@ -220,32 +243,14 @@ class HmsPatient(models.Model):
         """
         Validate email address format.
         """
-        for record in self:
-            if record.email:
-                email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                if not re.match(email_pattern, record.email):
-                    raise ValidationError(
-                        f"Invalid email format: '{record.email}'. "
-                        "Please enter a valid email address."
-                    )
-
-    @api.constrains("email")
-    def _check_email_unique(self):
-        """
-        Ensure email address is unique across all patients.
-        """
-        for record in self:
-            if record.email:
-                duplicate_patient = self.search(
-                    [("email", "=", record.email), ("id", "!=", record.id)], limit=1
-                )
-
-                if duplicate_patient:
-                    raise ValidationError(
-                        f"Email address '{record.email}' is already used by another patient: "
-                        f"{duplicate_patient.first_name} {duplicate_patient.last_name}. "
-                        "Please use a different email address."
-                    )
+        invalid = self.filtered(
+            lambda record: record.email and not _EMAIL_RE.match(record.email)
+        )
+        if invalid:
+            raise ValidationError(
+                f"Invalid email format: '{invalid[0].email}'. "
+                "Please enter a valid email address."
+            )
 
     @api.constrains("birth_date")
     def _check_birth_date_valid(self):
@@ -253,21 +258,21 @@ class HmsPatient(models.Model):
         Ensure birth date is not in the future.
         """
         today = date.today()
-        for record in self:
-            if record.birth_date and record.birth_date > today:
-                raise ValidationError(
-                    "Birth date cannot be in the future. "
-                    f"Please enter a valid birth date before {today}."
-                )
+        if self.filtered(
+            lambda record: record.birth_date and record.birth_date > today
+        ):
+            raise ValidationError(
+                "Birth date cannot be in the future. "
+                f"Please enter a valid birth date before {today}."
+            )
 
     @api.constrains("cr_ratio")
     def _check_cr_ratio_positive(self):
         """
         Ensure CR ratio is positive when provided.
         """
-        for record in self:
-            if record.cr_ratio and record.cr_ratio < 0:
-                raise ValidationError("CR Ratio must be a positive number.")
+        if self.filtered(lambda record: record.cr_ratio < 0):
+            raise ValidationError("CR Ratio must be a positive number.")
 
     # ========================================
     # ONCHANGE METHODS
@@ -287,7 +292,7 @@ class HmsPatient(models.Model):
                 )
 
         # Clear doctor assignments when department changes
-        self.doctors_ids = [(5, 0, 0)]  # Remove all doctor assignments
+        self.doctors_ids = [Command.clear()]  # Remove all doctor assignments
 
     @api.onchange("pcr", "cr_ratio")
     def _onchange_pcr(self):
@@ -300,93 +305,117 @@ class HmsPatient(models.Model):
                 "Please enter a valid CR Ratio value."
             )
 
-    @api.onchange("age")
-    def _onchange_age(self):
+    @api.onchange("birth_date")
+    def _onchange_birth_date(self):
         """
-        Handle age-related automatic field updates.
+        Show the age in the form before saving (the stored value is set by
+        the database trigger) and warn when PCR gets enabled automatically.
         """
-        if self.age:
-            # Clear medical history for patients under 50
-            if self.age < 50:
-                self.history = False
-
-            # Auto-check PCR for patients under 30
-            if self.age < 30 and not self.pcr:
-                self.pcr = True
-                return {
-                    "warning": {
-                        "title": "PCR Automatically Enabled",
-                        "message": "PCR has been automatically enabled because the patient is under 30 years old.",
-                    }
+        age = 0
+        if self.birth_date:
+            age = max(0, _get_age(self.birth_date, date.today()))
+        self.age = age
+
+        if self.birth_date and not self._origin.pcr and age < 30:
+            return {
+                "warning": {
+                    "title": "PCR Automatically Enabled",
+                    "message": "PCR has been automatically enabled because the patient is under 30 years old.",
                 }
+            }
 
     # ========================================
     # OVERRIDE METHODS
     # ========================================
 
-    def name_get(self):
+    def _auto_init(self):
         """
-        Custom display name format for patient records.
+        The patient age is maintained by a trigger on birth date changes
+        (a generated column cannot use CURRENT_DATE), and refreshed for all
+        patients on every module update.
         """
-        result = []
-        for record in self:
-            name = f"{record.first_name} {record.last_name} ({record.email})"
-            result.append((record.id, name))
-        return result
+        res = super()._auto_init()
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE FUNCTION hms_patient_age(birth_date date) RETURNS integer AS $$
+                SELECT GREATEST(
+                    0, COALESCE(EXTRACT(YEAR FROM AGE(CURRENT_DATE, birth_date))::int, 0)
+                );
+            $$ LANGUAGE sql STABLE;
+
+            CREATE OR REPLACE FUNCTION hms_patient_compute_age() RETURNS trigger AS $$
+            BEGIN
+                NEW.age := hms_patient_age(NEW.birth_date);
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            DROP TRIGGER IF EXISTS hms_patient_age_trigger ON hms_patient;
+            CREATE TRIGGER hms_patient_age_trigger
+                BEFORE INSERT OR UPDATE OF birth_date ON hms_patient
+                FOR EACH ROW EXECUTE FUNCTION hms_patient_compute_age();
+
+            UPDATE hms_patient
+               SET age = hms_patient_age(birth_date)
+             WHERE age IS DISTINCT FROM hms_patient_age(birth_date);
+            """
+        )
+        return res
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """
         Override create method to log patient creation.
         """
-        patient = super(HmsPatient, self).create(vals)
+        patients = super().create(vals_list)
 
-        # Create initial log entry
-        initial_state = dict(self._fields["state"].selection).get(
-            patient.state, patient.state
+        # Create initial log entries for all new patients at once
+        self.env["hms.patient.log"].create(
+            [
+                {
+                    "patient_id": patient.id,
+                    "description": "Patient created with initial state: "
+                    f"{_STATE_LABELS.get(patient.state, patient.state)}",
+                }
+                for patient in patients
+            ]
         )
 
-        patient.env["hms.patient.log"].create(
-            {
-                "patient_id": patient.id,
-                "description": f"Patient created with initial state: {initial_state}",
-            }
-        )
+        # Age is set by the database trigger on insert
+        patients.invalidate_recordset(["age"])
 
-        return patient
+        return patients
 
     def write(self, vals):
         """
         Override write method to log state changes.
         """
         # Log state changes before updating
-        for record in self:
-            if "state" in vals and vals["state"] != record.state:
-                old_state = dict(self._fields["state"].selection).get(
-                    record.state, record.state
-                )
-                new_state = dict(self._fields["state"].selection).get(
-                    vals["state"], vals["state"]
-                )
+        if "state" in vals:
+            new_state = _STATE_LABELS.get(vals["state"], vals["state"])
+            log_vals_list = []
+            for record in self:
+                if vals["state"] != record.state:
+                    old_state = _STATE_LABELS.get(record.state, record.state)
+                    log_vals_list.append(
+                        {
+                            "patient_id": record.id,
+                            "description": f"State changed from {old_state} to {new_state}",
+                        }
+                    )
 
-                # Create log entry for state change
-                record.env["hms.patient.log"].create(
-                    {
-                        "patient_id": record.id,
-                        "description": f"State changed from {old_state} to {new_state}",
-                    }
-                )
+            # Create all state change log entries at once
+            if log_vals_list:
+                self.env["hms.patient.log"].create(log_vals_list)
 
-        return super(HmsPatient, self).write(vals)
+        res = super().write(vals)
 
-    @api.model
-    def _search(self, args, offset=0, limit=None, order=None, count=False):
-        user = self.env.user
-        if user.has_group("hms.group_hms_user") and not user.has_group(
-            "hms.group_hms_manager"
-        ):
-            args = args + [("create_uid", "=", user.id)]
-        return super()._search(args, offset=offset, limit=limit, order=order)
+        # Age is updated by the database trigger when the birth date changes
+        if "birth_date" in vals:
+            self.flush_recordset(["birth_date"])
+            self.invalidate_recordset(["age"])
+
+        return res
 
     # ========================================
     # UTILITY METHODS
@@ -422,18 +451,75 @@ class HmsPatient(models.Model):
         """
         self.ensure_one()
 
-        return {
-            "name": f"{self.first_name} {self.last_name}",
-            "age": self.age,
-            "blood_type": self.blood_type,
-            "state": self.state,
-            "department": (
-                self.department_id.name if self.department_id else "Not Assigned"
-            ),
-            "pcr_required": self.pcr,
-            "cr_ratio": self.cr_ratio if self.pcr else None,
-            "assigned_doctors": len(self.doctors_ids),
+        return self.get_medical_summaries()[0]
+
+    def get_medical_summaries(self):
+        """
+        Get a summary of medical information for all patients at once.
+
+        Patient fields, department names and doctor counts are each fetched
+        with a single query, whatever the number of patients.
+
+        Returns:
+            list: Dictionaries containing medical summaries, in recordset order
+        """
+        patients_data = self.read(
+            [
+                "first_name",
+                "last_name",
+                "age",
+                "blood_type",
+                "state",
+                "department_id",
+                "pcr",
+                "cr_ratio",
+            ],
+            load=None,
+        )
+        department_names = {
+            department["id"]: department["name"]
+            for department in self.department_id.read(["name"])
         }
+        doctor_counts = self._get_doctor_counts()
+
+        return [
+            {
+                "name": f"{data['first_name']} {data['last_name']}",
+                "age": data["age"],
+                "blood_type": data["blood_type"],
+                "state": data["state"],
+                "department": department_names.get(
+                    data["department_id"], "Not Assigned"
+                ),
+                "pcr_required": data["pcr"],
+                "cr_ratio": data["cr_ratio"] if data["pcr"] else None,
+                "assigned_doctors": doctor_counts.get(data["id"], 0),
+            }
+            for data in patients_data
+        ]
+
+    def _get_doctor_counts(self):
+        """
+        Count the doctors assigned to each patient in a single query.
+
+        Returns:
+            dict: Number of assigned doctors by patient id
+        """
+        if not self.ids:
+            return {}
+
+        self.flush_model(["doctors_ids"])
+        self.env["hms.doctors"].flush_model(["patient_ids"])
+        self.env.cr.execute(
+            """
+            SELECT patient_id, COUNT(*)
+              FROM hms_patient_doctor_rel
+             WHERE patient_id = ANY(%s)
+          GROUP BY patient_id
+            """,
+            [self.ids],
+        )
+        return dict(self.env.cr.fetchall())
 
     def print_patient_status_report(self):
         return self.env.ref("hms.action_report_hms_patient_status").report_action(self)
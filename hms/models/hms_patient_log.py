@@ -6,8 +6,15 @@ This module defines the Patient Log model for the Hospital Management System.
 It tracks all activities and changes related to patients for audit purposes.
 """
 
+from datetime import datetime, timedelta
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
+from odoo.osv import expression
+from odoo.tools.sql import create_index
+
+# Keywords identifying medical information updates
+_MEDICAL_KEYWORDS = ("medical", "pcr", "blood", "cr ratio")
 
 
 class HmsPatientLog(models.Model):
@@ -45,6 +52,7 @@ class HmsPatientLog(models.Model):
         string="Date & Time",
         default=fields.Datetime.now,
         required=True,
+        index=True,
         help="When this activity occurred",
     )
 
@@ -73,6 +81,7 @@ class HmsPatientLog(models.Model):
         string="Log Type",
         default="manual_entry",
         required=True,
+        index=True,
         help="Category of this log entry",
     )
 
@@ -85,6 +94,7 @@ class HmsPatientLog(models.Model):
         ],
         string="Priority",
         default="normal",
+        index=True,
         help="Priority level of this log entry",
     )
 
@@ -96,16 +106,38 @@ class HmsPatientLog(models.Model):
         string="Patient Name",
         related="patient_id.display_name",
         store=True,
+        index="trigram",
         help="Name of the patient for easy reference",
     )
 
+    display_name = fields.Char(
+        string="Display Name",
+        compute="_compute_display_name",
+        store=True,
+        help="Patient name and date of the log entry",
+    )
+
     creator_name = fields.Char(
         string="Creator Name",
         related="created_by.name",
-        store=True,
         help="Name of the user who created this log entry",
     )
 
+    # ========================================
+    # COMPUTED FIELD METHODS
+    # ========================================
+
+    @api.depends("patient_name", "date")
+    def _compute_display_name(self):
+        """
+        Compute display name in the format "Patient Name - Date Time".
+        """
+        for record in self:
+            formatted_date = (
+                record.date.strftime("%Y-%m-%d %H:%M") if record.date else ""
+            )
+            record.display_name = f"{record.patient_name} - {formatted_date}"
+
     # ========================================
     # VALIDATION METHODS
     # ========================================
@@ -115,12 +147,14 @@ class HmsPatientLog(models.Model):
         """
         Ensure log description is not empty or just whitespace.
         """
-        for record in self:
-            if not record.description or not record.description.strip():
-                raise ValidationError(
-                    "Log description cannot be empty. "
-                    "Please provide a meaningful description of the activity."
-                )
+        if any(
+            not description or not description.strip()
+            for description in self.mapped("description")
+        ):
+            raise ValidationError(
+                "Log description cannot be empty. "
+                "Please provide a meaningful description of the activity."
+            )
 
     @api.constrains("date")
     def _check_date_not_future(self):
@@ -128,58 +162,70 @@ class HmsPatientLog(models.Model):
         Ensure log date is not in the future.
         """
         now = fields.Datetime.now()
-        for record in self:
-            if record.date and record.date > now:
-                raise ValidationError(
-                    "Log date cannot be in the future. "
-                    "Please use the current date and time or earlier."
-                )
+        if self.filtered(lambda record: record.date and record.date > now):
+            raise ValidationError(
+                "Log date cannot be in the future. "
+                "Please use the current date and time or earlier."
+            )
 
     # ========================================
     # OVERRIDE METHODS
     # ========================================
 
-    def name_get(self):
+    def _auto_init(self):
         """
-        Custom display name format for log entries.
+        Index log entries by patient and date, matching the per-patient
+        activity lookups and the default date ordering.
         """
-        result = []
-        for record in self:
-            # Format: "Patient Name - Date Time"
-            patient_name = (
-                f"{record.patient_id.first_name} {record.patient_id.last_name}"
-            )
-            formatted_date = record.date.strftime("%Y-%m-%d %H:%M")
-            name = f"{patient_name} - {formatted_date}"
-            result.append((record.id, name))
-        return result
+        res = super()._auto_init()
+        create_index(
+            self.env.cr,
+            "hms_patient_log_patient_date_idx",
+            self._table,
+            ["patient_id", "date DESC"],
+        )
+        return res
 
     @api.model
-    def create(self, vals):
+    def _name_search(self, name, domain=None, operator="ilike", limit=None, order=None):
+        """
+        Search log entries by patient name first, then by description.
+        """
+        if name and operator not in expression.NEGATIVE_TERM_OPERATORS:
+            patient_domain = expression.AND(
+                [domain or [], [("patient_name", operator, name)]]
+            )
+            ids = list(self._search(patient_domain, limit=limit, order=order))
+            if ids:
+                return ids
+        return super()._name_search(
+            name, domain=domain, operator=operator, limit=limit, order=order
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
         """
         Override create method to add automatic categorization.
         """
-        # Auto-detect log type based on description keywords
-        if "log_type" not in vals or vals["log_type"] == "manual_entry":
-            description = vals.get("description", "").lower()
-
-            if "created" in description and "initial state" in description:
-                vals["log_type"] = "creation"
-            elif "state changed" in description:
-                vals["log_type"] = "state_change"
-            elif "department" in description:
-                vals["log_type"] = "department_change"
-            elif "doctor" in description:
-                vals["log_type"] = "doctor_assignment"
-            elif any(
-                keyword in description
-                for keyword in ["medical", "pcr", "blood", "cr ratio"]
-            ):
-                vals["log_type"] = "medical_update"
-            elif "system" in description or "automatic" in description:
-                vals["log_type"] = "system_note"
-
-        return super(HmsPatientLog, self).create(vals)
+        for vals in vals_list:
+            # Auto-detect log type based on description keywords
+            if "log_type" not in vals or vals["log_type"] == "manual_entry":
+                description = (vals.get("description") or "").lower()
+
+                if "created" in description and "initial state" in description:
+                    vals["log_type"] = "creation"
+                elif "state changed" in description:
+                    vals["log_type"] = "state_change"
+                elif "department" in description:
+                    vals["log_type"] = "department_change"
+                elif "doctor" in description:
+                    vals["log_type"] = "doctor_assignment"
+                elif any(keyword in description for keyword in _MEDICAL_KEYWORDS):
+                    vals["log_type"] = "medical_update"
+                elif "system" in description or "automatic" in description:
+                    vals["log_type"] = "system_note"
+
+        return super().create(vals_list)
 
     # ========================================
     # UTILITY METHODS
@@ -226,26 +272,28 @@ class HmsPatientLog(models.Model):
         Returns:
             dict: Summary of activities
         """
-        from datetime import datetime, timedelta
-
         start_date = datetime.now() - timedelta(days=days)
+        domain = [("patient_id", "=", patient_id), ("date", ">=", start_date)]
 
-        logs = self.search(
-            [("patient_id", "=", patient_id), ("date", ">=", start_date)]
-        )
-
-        summary = {
-            "total_activities": len(logs),
-            "by_type": {},
-            "by_priority": {},
-            "recent_activities": logs[:5].mapped("description"),
+        # Count activities by type and by priority in the database
+        by_type = {
+            group["log_type"]: group["log_type_count"]
+            for group in self.read_group(domain, ["log_type"], ["log_type"])
+        }
+        by_priority = {
+            group["priority"]: group["priority_count"]
+            for group in self.read_group(domain, ["priority"], ["priority"])
         }
 
-        # Group by type
-        for log in logs:
-            log_type = log.log_type
-            if log_type not in summary["by_type"]:
-                summary["by_type"][log_type] = 0
-            summary["by_type"][log_type] += 1
+        recent_activities = self.search_read(
+            domain, ["description"], limit=5, order="date desc, id desc"
+        )
 
-        # Group by
+        return {
+            "total_activities": sum(by_type.values()),
+            "by_type": by_type,
+            "by_priority": by_priority,
+            "recent_activities": [
+                activity["description"] for activity in recent_activities
+            ],
+        }
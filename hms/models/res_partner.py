@@ -18,6 +18,9 @@ class ResPartner(models.Model):
     @api.constrains("related_patient_id", "email")
     def _check_patient_email_constraints(self):
         """Check all email-related constraints when patient is linked"""
+        # Load the emails of all linked patients in one query
+        self.related_patient_id.fetch(["email"])
+
         for record in self:
             if record.related_patient_id:
                 # First check: Customer email cannot be empty when patient is linked
@@ -44,36 +47,46 @@ class ResPartner(models.Model):
     @api.constrains("related_patient_id")
     def _check_patient_not_linked_elsewhere(self):
         """Prevent linking patient that is already linked to another customer"""
-        for record in self:
-            if record.related_patient_id:
-                # Check if this patient is already linked to another customer
-                existing_customer = self.search(
-                    [
-                        ("related_patient_id", "=", record.related_patient_id.id),
-                        ("id", "!=", record.id),
-                    ],
-                    limit=1,
-                )  # Add limit=1 to ensure we get only one record
+        patient_ids = self.related_patient_id.ids
+        if not patient_ids:
+            return
 
-                if existing_customer:
-                    raise ValidationError(
-                        f"Patient '{record.related_patient_id.first_name} "
-                        f"{record.related_patient_id.last_name}' is already linked "
-                        f"to customer '{existing_customer.name}'. "
-                        f"A patient can only be linked to one customer."
-                    )
+        # Fetch the other customers linked to these patients in one query
+        existing_customers = self.env["res.partner"].sudo().search_fetch(
+            [
+                ("related_patient_id", "in", patient_ids),
+                ("id", "not in", self.ids),
+            ],
+            ["related_patient_id", "name"],
+        )
+        customers_by_patient = {
+            customer.related_patient_id.id: customer for customer in existing_customers
+        }
+
+        for record in self.filtered("related_patient_id"):
+            patient_id = record.related_patient_id.id
+            existing_customer = customers_by_patient.get(patient_id)
+            # Also catches two customers of this batch linked to the same patient
+            customers_by_patient[patient_id] = record
+
+            if existing_customer:
+                raise ValidationError(
+                    f"Patient '{record.related_patient_id.display_name}' is already linked "
+                    f"to customer '{existing_customer.name}'. "
+                    f"A patient can only be linked to one customer."
+                )
 
     def unlink(self):
         """Prevent deletion of customers linked to patients"""
-        for record in self:
-            if record.related_patient_id:
-                raise UserError(
-                    f"Cannot delete customer '{record.name}' because it's linked "
-                    f"to patient '{record.related_patient_id.first_name} "
-                    f"{record.related_patient_id.last_name}'. "
-                    f"Please unlink the patient first."
-                )
-        return super(ResPartner, self).unlink()
+        linked = self.filtered("related_patient_id")
+        if linked:
+            record = linked[0]
+            raise UserError(
+                f"Cannot delete customer '{record.name}' because it's linked "
+                f"to patient '{record.related_patient_id.display_name}'. "
+                f"Please unlink the patient first."
+            )
+        return super().unlink()
 
     @api.onchange("related_patient_id")
     def _onchange_related_patient_id(self):